@@ -1,7 +1,8 @@
 # backend/main.py
 from fastapi import FastAPI, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
+from typing import List, Optional, Tuple
+from pydantic import BaseModel
 
 from shapely.geometry import (
     shape,
@@ -14,6 +15,7 @@ from shapely.geometry import (
 from shapely.ops import split
 import json
 import csv
+import threading
 from io import StringIO
 
 import networkx as nx  # <- para shortest path sobre la red
@@ -24,6 +26,8 @@ from tsp_algorithms import (
     brute_force_tsp_matrix,
     nearest_neighbor_tsp_matrix,
     simulated_annealing_tsp_matrix,
+    cheapest_insertion_matrix,
+    two_opt_matrix,
 )
 
 app = FastAPI(title="TSP-POC Backend", version="0.3.0")
@@ -37,10 +41,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Fuerza bruta es O(n!): por encima de este número de puntos no se ejecuta
+BRUTE_FORCE_MAX_POINTS = 9
+
 # Almacenamiento en memoria (POC)
 EDGES: List[LineString] = []        # red vial cargada (lista de aristas)
 POINTS_SNAPPED: List[dict] = []     # puntos integrados (snapped a la red)
 
+# Caché de la última evaluación TSP (alineada con POINTS_SNAPPED)
+DIST_MATRIX: List[List[float]] = []         # distancias más cortas en la red
+PATH_MATRIX: List[List[List[tuple]]] = []   # caminos sobre la red
+BEST_ROUTE: List[int] = []                  # mejor ruta conocida (índices)
+GRAPH: Optional[nx.Graph] = None            # grafo de la red (alineado con EDGES)
+CACHE_VERSION = 0                           # cambia cada vez que se toca la caché
+
+# Los endpoints síncronos corren en paralelo (thread pool de FastAPI):
+# todo acceso a EDGES, POINTS_SNAPPED o la caché va protegido por este lock.
+# Es un lock de threads: solo se toma desde endpoints `def` (nunca `async def`,
+# bloquearía el event loop) y nunca durante el cálculo completo de la matriz.
+STATE_LOCK = threading.Lock()
+
+
+class PointIn(BaseModel):
+    """Punto individual para POST /points."""
+    id: str
+    lat: float
+    lon: float
+
 
 @app.get("/health")
 def health():
@@ -52,7 +79,7 @@ def health():
 # =====================================================
 
 @app.post("/upload/network")
-async def upload_network(file: UploadFile):
+def upload_network(file: UploadFile):
     """
     Sube un GeoJSON (FeatureCollection de LineString).
     Se valida por contenido (JSON) y no por content-type del navegador.
@@ -61,7 +88,7 @@ async def upload_network(file: UploadFile):
       - Cargar red vial desde archivo local
       - Representar la red internamente como aristas (LineString)
     """
-    raw_bytes = await file.read()
+    raw_bytes = file.file.read()
 
     # Intentamos parsear JSON (independiente del content-type)
     try:
@@ -87,8 +114,10 @@ async def upload_network(file: UploadFile):
         edges.append(g)
 
     global EDGES, POINTS_SNAPPED
-    EDGES = edges
-    POINTS_SNAPPED = []  # si suben nueva red, reseteamos puntos integrados
+    with STATE_LOCK:
+        EDGES = edges
+        POINTS_SNAPPED = []  # si suben nueva red, reseteamos puntos integrados
+        invalidate_tsp_cache()
 
     return {"ok": True, "lines": len(EDGES)}
 
@@ -126,8 +155,86 @@ async def get_network_wkt():
 # 3.2 Pointset Load: integración de puntos en la red
 # =====================================================
 
+def snap_point_to_network(pid: str, lat: float, lon: float) -> Tuple[dict, List[LineString]]:
+    """
+    Integra un punto (lat, lon) en la red:
+      - Busca la arista más cercana (distancia mínima punto-línea).
+      - Proyecta el punto sobre esa arista.
+      - Parte la arista en dos segmentos que incluyen el punto proyectado
+        (si cae en un extremo, la red no se modifica).
+
+    Actualiza EDGES y devuelve (info del punto integrado, segmentos nuevos).
+    Los segmentos reemplazan a EDGES[info["edge_index"]] de la red anterior;
+    la lista queda vacía si la arista no se partió. El punto no se agrega
+    a POINTS_SNAPPED.
+    """
+    global EDGES
+
+    # En coordenadas geoespaciales usuales, GeoJSON usa [lon, lat]
+    p = Point(lon, lat)
+
+    # Buscar la arista más cercana (distancia mínima punto-línea)
+    best_idx = None
+    best_dist = None
+    best_proj_point = None
+
+    for idx, edge in enumerate(EDGES):
+        d = edge.distance(p)
+        if best_dist is None or d < best_dist:
+            best_dist = d
+            # proyectamos el punto sobre la línea
+            proj_point = edge.interpolate(edge.project(p))
+            best_idx = idx
+            best_proj_point = proj_point
+
+    if best_idx is None or best_proj_point is None:
+        raise HTTPException(400, "Primero debe cargarse una red (/upload/network).")
+
+    edge_to_split = EDGES[best_idx]
+
+    # Preparamos la info del punto integrado (da igual si luego se parte o no)
+    snapped_info = {
+        "id": pid,
+        "original": {"type": "Point", "coordinates": [lon, lat]},
+        "snapped": mapping(best_proj_point),
+        "edge_index": best_idx,
+        "distance_to_edge": best_dist,
+    }
+
+    # Intentamos partir la arista elegida usando el punto proyectado
+    parts_raw = split(edge_to_split, best_proj_point)
+
+    # Shapely 2: GeometryCollection/MultiLineString no son iterables directos
+    if isinstance(parts_raw, (GeometryCollection, MultiLineString)):
+        geoms_iter = parts_raw.geoms
+    else:
+        geoms_iter = [parts_raw]
+
+    # Filtramos solo LineString válidas
+    parts: List[LineString] = []
+    for geom in geoms_iter:
+        if isinstance(geom, LineString) and len(geom.coords) >= 2:
+            parts.append(geom)
+
+    if len(parts) < 2:
+        # No se partió la arista (por ejemplo, el punto coincide con un extremo).
+        # En este caso: NO modificamos EDGES, pero SÍ registramos el punto.
+        return snapped_info, []
+
+    # Caso normal: actualizamos la lista de aristas
+    new_edges = list(EDGES)
+    # Removemos la arista original
+    del new_edges[best_idx]
+    # Insertamos las nuevas aristas en la misma posición
+    for geom in reversed(parts):
+        new_edges.insert(best_idx, geom)
+
+    EDGES = new_edges
+    return snapped_info, parts
+
+
 @app.post("/upload/points")
-async def upload_points(file: UploadFile):
+def upload_points(file: UploadFile):
     """
     Sube un CSV con columnas: id, lat, lon (nombres flexibles).
       - id: identificador del punto
@@ -148,7 +255,7 @@ async def upload_points(file: UploadFile):
         raise HTTPException(400, "Primero debe cargarse una red (/upload/network).")
 
     try:
-        raw_bytes = await file.read()
+        raw_bytes = file.file.read()
         try:
             text = raw_bytes.decode("utf-8")
         except Exception:
@@ -181,8 +288,9 @@ async def upload_points(file: UploadFile):
                 "El CSV debe tener columnas para id, lat, lon (por ejemplo: id,lat,lon).",
             )
 
-        points_added = 0
-
+        # Leemos y validamos todas las filas antes de tocar la red
+        rows = []
+        seen_ids = set()
         for row in reader:
             pid = row[field_id]
             try:
@@ -196,77 +304,27 @@ async def upload_points(file: UploadFile):
                         f"(lat={row.get(field_lat)}, lon={row.get(field_lon)})."
                     ),
                 )
+            if pid in seen_ids:
+                raise HTTPException(400, f"El CSV repite el id={pid}.")
+            seen_ids.add(pid)
+            rows.append((pid, lat, lon))
 
-            # En coordenadas geoespaciales usuales, GeoJSON usa [lon, lat]
-            p = Point(lon, lat)
-
-            # Buscar la arista más cercana (distancia mínima punto-línea)
-            best_idx = None
-            best_dist = None
-            best_proj_point = None
-
-            for idx, edge in enumerate(EDGES):
-                d = edge.distance(p)
-                if best_dist is None or d < best_dist:
-                    best_dist = d
-                    # proyectamos el punto sobre la línea
-                    proj_point = edge.interpolate(edge.project(p))
-                    best_idx = idx
-                    best_proj_point = proj_point
-
-            if best_idx is None or best_proj_point is None:
-                # No debería ocurrir si EDGES no está vacío, pero por seguridad:
-                continue
-
-            edge_to_split = EDGES[best_idx]
-
-            # Preparamos la info del punto integrado (da igual si luego se parte o no)
-            snapped_info = {
-                "id": pid,
-                "original": {"type": "Point", "coordinates": [lon, lat]},
-                "snapped": mapping(best_proj_point),
-                "edge_index": best_idx,
-                "distance_to_edge": best_dist,
-            }
-
-            # Intentamos partir la arista elegida usando el punto proyectado
-            parts_raw = split(edge_to_split, best_proj_point)
-
-            # Shapely 2: GeometryCollection/MultiLineString no son iterables directos
-            if isinstance(parts_raw, (GeometryCollection, MultiLineString)):
-                geoms_iter = parts_raw.geoms
-            else:
-                geoms_iter = [parts_raw]
-
-            # Filtramos solo LineString válidas
-            parts: List[LineString] = []
-            for geom in geoms_iter:
-                if isinstance(geom, LineString) and len(geom.coords) >= 2:
-                    parts.append(geom)
-
-            if len(parts) < 2:
-                # No se partió la arista (por ejemplo, el punto coincide con un extremo).
-                # En este caso: NO modificamos EDGES, pero SÍ registramos el punto.
-                POINTS_SNAPPED.append(snapped_info)
-                points_added += 1
-                continue
-
-            # Caso normal: actualizamos la lista de aristas
-            new_edges = list(EDGES)
-            # Removemos la arista original
-            del new_edges[best_idx]
-            # Insertamos las nuevas aristas en la misma posición
-            for geom in reversed(parts):
-                new_edges.insert(best_idx, geom)
+        if not rows:
+            raise HTTPException(400, "No se integró ningún punto (¿CSV vacío?).")
 
-            EDGES = new_edges
+        with STATE_LOCK:
+            # Los ids deben ser únicos para que DELETE /points/{id} no sea ambiguo
+            for p in POINTS_SNAPPED:
+                if p["id"] in seen_ids:
+                    raise HTTPException(400, f"Ya existe un punto con id={p['id']}.")
 
-            # Guardamos el punto integrado para que el front lo pueda dibujar
-            POINTS_SNAPPED.append(snapped_info)
-            points_added += 1
+            # Carga masiva: la matriz se recalcula completa en la próxima evaluación
+            invalidate_tsp_cache()
 
-        if points_added == 0:
-            raise HTTPException(400, "No se integró ningún punto (¿CSV vacío?).")
+            for pid, lat, lon in rows:
+                snapped_info, _ = snap_point_to_network(pid, lat, lon)
+                POINTS_SNAPPED.append(snapped_info)
+            points_added = len(rows)
 
         return {
             "ok": True,
@@ -284,18 +342,21 @@ async def upload_points(file: UploadFile):
 
 
 @app.get("/points.geojson")
-async def get_points_geojson():
+def get_points_geojson():
     """
     Devuelve los puntos integrados a la red como GeoJSON (usamos la posición 'snapped').
     El frontend puede pintarlos con otro estilo (forma/color) para cumplir el requerimiento.
 
     Requerimiento 3.2: mostrar nodos integrados con estilo diferente.
     """
-    if not POINTS_SNAPPED:
+    with STATE_LOCK:
+        points = list(POINTS_SNAPPED)
+
+    if not points:
         raise HTTPException(404, "No hay puntos integrados.")
 
     features = []
-    for p in POINTS_SNAPPED:
+    for p in points:
         feat = {
             "type": "Feature",
             "geometry": p["snapped"],
@@ -313,14 +374,14 @@ async def get_points_geojson():
 # Helpers para TSP sobre la red
 # =====================================================
 
-def get_snapped_points_coordinates():
+def get_snapped_points_coordinates(points: List[dict]):
     """
     Devuelve la lista de coordenadas (lon, lat) de los puntos integrados.
     """
-    if not POINTS_SNAPPED:
+    if not points:
         raise HTTPException(status_code=400, detail="No hay puntos integrados.")
     coords = []
-    for p in POINTS_SNAPPED:
+    for p in points:
         lon, lat = p["snapped"]["coordinates"]
         coords.append((lon, lat))
     if len(coords) < 2:
@@ -331,49 +392,81 @@ def get_snapped_points_coordinates():
     return coords
 
 
-def build_network_graph() -> nx.Graph:
+def build_network_graph(edges: List[LineString]) -> nx.Graph:
     """
-    Construye un grafo no dirigido a partir de EDGES.
+    Construye un grafo no dirigido a partir de las aristas de la red.
     Cada vértice es una coordenada (lon, lat).
     Cada arista conecta dos coordenadas consecutivas de un LineString,
     con peso igual a la distancia geográfica (Haversine).
     """
-    if not EDGES:
+    if not edges:
         raise HTTPException(status_code=400, detail="No hay red cargada.")
 
     G = nx.Graph()
 
-    for ls in EDGES:
-        coords = list(ls.coords)
-        for i in range(len(coords) - 1):
-            lon1, lat1 = coords[i]
-            lon2, lat2 = coords[i + 1]
+    for ls in edges:
+        add_linestring_to_graph(G, ls)
 
-            u = (lon1, lat1)
-            v = (lon2, lat2)
+    return G
 
-            d = geo_distance(Point(lon1, lat1), Point(lon2, lat2))
 
-            if G.has_edge(u, v):
-                # Por si el GeoJSON tiene segmentos duplicados, guardamos el mínimo
-                if d < G[u][v]["weight"]:
-                    G[u][v]["weight"] = d
-            else:
-                G.add_edge(u, v, weight=d)
+def add_linestring_to_graph(G: nx.Graph, ls: LineString):
+    """
+    Agrega al grafo los segmentos consecutivos de un LineString,
+    pesados con la distancia Haversine.
+    """
+    coords = list(ls.coords)
+    for i in range(len(coords) - 1):
+        lon1, lat1 = coords[i]
+        lon2, lat2 = coords[i + 1]
 
-    return G
+        u = (lon1, lat1)
+        v = (lon2, lat2)
 
+        d = geo_distance(Point(lon1, lat1), Point(lon2, lat2))
 
-def compute_distance_and_paths():
+        if G.has_edge(u, v):
+            # Por si el GeoJSON tiene segmentos duplicados, guardamos el mínimo
+            if d < G[u][v]["weight"]:
+                G[u][v]["weight"] = d
+        else:
+            G.add_edge(u, v, weight=d)
+
+
+def replace_edge_in_graph(G: nx.Graph, old: LineString, parts: List[LineString]):
+    """
+    Actualiza el grafo en el lugar cuando una arista se parte en `parts`:
+    quita los segmentos de `old` que ya no existen y agrega los nuevos.
+    (Si otra arista de la red tenía el mismo segmento, también se pierde;
+    /tsp/evaluate?rebuild=true reconstruye el grafo completo.)
+    """
+    def segments(ls: LineString):
+        coords = [tuple(c) for c in ls.coords]
+        return {frozenset((coords[i], coords[i + 1])) for i in range(len(coords) - 1)}
+
+    new_segments = set()
+    for ls in parts:
+        new_segments |= segments(ls)
+
+    for seg in segments(old) - new_segments:
+        u, v = tuple(seg)
+        if G.has_edge(u, v):
+            G.remove_edge(u, v)
+
+    for ls in parts:
+        add_linestring_to_graph(G, ls)
+
+
+def compute_distance_and_paths(G: nx.Graph, points: List[dict]):
     """
     Construye:
       - dist_matrix[i][j]: distancia más corta en la red entre puntos i y j.
       - path_matrix[i][j]: lista de coordenadas (lon, lat) que siguen la red.
 
-    Usa Dijkstra sobre el grafo de la red.
+    Usa Dijkstra sobre el grafo de la red. Trabaja sobre un grafo y una
+    copia de POINTS_SNAPPED propios para poder correr sin tomar STATE_LOCK.
     """
-    G = build_network_graph()
-    points_coords = get_snapped_points_coordinates()
+    points_coords = get_snapped_points_coordinates(points)
     n = len(points_coords)
 
     # Verificar que todos los puntos existan como nodos del grafo
@@ -410,6 +503,133 @@ def compute_distance_and_paths():
     return dist_matrix, path_matrix
 
 
+def invalidate_tsp_cache():
+    """
+    Descarta la caché de matrices y la mejor ruta conocida
+    (p. ej. al cargar una red o un CSV de puntos nuevo).
+    """
+    global DIST_MATRIX, PATH_MATRIX, BEST_ROUTE, GRAPH, CACHE_VERSION
+    DIST_MATRIX = []
+    PATH_MATRIX = []
+    BEST_ROUTE = []
+    GRAPH = None
+    CACHE_VERSION += 1
+
+
+def get_distance_and_paths(rebuild: bool = False):
+    """
+    Devuelve (dist_matrix, path_matrix, version): una copia de las matrices
+    y la versión de la caché a la que corresponden.
+
+    Si la caché sigue alineada con POINTS_SNAPPED (y no se pide rebuild)
+    se copia tal cual. Si no, se recalcula completa SIN tomar STATE_LOCK
+    (sobre una copia de la red y los puntos) y solo se instala en la caché
+    si nadie la modificó mientras tanto.
+    No debe llamarse con STATE_LOCK tomado.
+    """
+    global DIST_MATRIX, PATH_MATRIX, BEST_ROUTE, GRAPH, CACHE_VERSION
+
+    with STATE_LOCK:
+        version = CACHE_VERSION
+        if not rebuild and DIST_MATRIX and len(DIST_MATRIX) == len(POINTS_SNAPPED):
+            return [row[:] for row in DIST_MATRIX], [row[:] for row in PATH_MATRIX], version
+        edges = EDGES
+        points = list(POINTS_SNAPPED)
+
+    G = build_network_graph(edges)
+    dist_matrix, path_matrix = compute_distance_and_paths(G, points)
+
+    with STATE_LOCK:
+        if CACHE_VERSION == version:
+            DIST_MATRIX = [row[:] for row in dist_matrix]
+            PATH_MATRIX = [row[:] for row in path_matrix]
+            GRAPH = G
+            BEST_ROUTE = []
+            CACHE_VERSION += 1
+            version = CACHE_VERSION
+
+    return dist_matrix, path_matrix, version
+
+
+def shortest_paths_from_point(G: nx.Graph, coord: tuple):
+    """
+    Ejecuta un solo Dijkstra desde coord hacia todos los puntos integrados.
+    Devuelve (distancias, caminos) en el orden de POINTS_SNAPPED.
+    Lanza HTTPException si algún punto no es alcanzable, sin modificar estado.
+    """
+    if coord not in G.nodes:
+        raise HTTPException(
+            status_code=500,
+            detail=f"El punto integrado ({coord}) no se encuentra como nodo de la red.",
+        )
+
+    lengths, paths = nx.single_source_dijkstra(G, coord, weight="weight")
+
+    new_row: List[float] = []
+    new_paths: List[List[tuple]] = []
+    for j, p in enumerate(POINTS_SNAPPED):
+        lon, lat = p["snapped"]["coordinates"]
+        target = (lon, lat)
+        if target not in lengths or target not in paths:
+            raise HTTPException(
+                status_code=400,
+                detail=f"No hay camino en la red entre el punto nuevo y el punto {j}.",
+            )
+        new_row.append(float(lengths[target]))
+        new_paths.append(paths[target])
+
+    return new_row, new_paths
+
+
+def extend_distance_and_paths(
+    coord: tuple,
+    new_row: List[float],
+    new_paths: List[List[tuple]],
+) -> int:
+    """
+    Agrega a la caché una fila y una columna para un punto nuevo
+    (el último de POINTS_SNAPPED) a partir de shortest_paths_from_point.
+
+    Las filas de los puntos ya existentes no se recalculan, así que la
+    caché queda aproximada: el punto se proyecta en lon/lat planas y los
+    pesos son Haversine, por lo que partir una arista puede alargar un
+    poco los caminos que pasan por ella (hav(A,P) + hav(P,B) >= hav(A,B)).
+    /tsp/evaluate?rebuild=true recalcula la matriz completa y exacta.
+    Como el grafo es no dirigido, el camino j -> nuevo es el inverso
+    del camino nuevo -> j.
+
+    Devuelve el índice del nuevo punto.
+    """
+    global CACHE_VERSION
+
+    new_idx = len(DIST_MATRIX)
+
+    for j in range(new_idx):
+        DIST_MATRIX[j].append(new_row[j])
+        PATH_MATRIX[j].append(list(reversed(new_paths[j])))
+
+    DIST_MATRIX.append(new_row + [0.0])
+    PATH_MATRIX.append(new_paths + [[coord]])
+    CACHE_VERSION += 1
+
+    return new_idx
+
+
+def shrink_distance_and_paths(idx: int):
+    """
+    Elimina de la caché la fila y la columna del punto idx.
+    """
+    global CACHE_VERSION
+
+    del DIST_MATRIX[idx]
+    del PATH_MATRIX[idx]
+    for row in DIST_MATRIX:
+        del row[idx]
+    for row in PATH_MATRIX:
+        del row[idx]
+    CACHE_VERSION += 1
+
+
 def route_nodes_to_geojson_feature(route: List[int], path_matrix: List[List[List[tuple]]]):
     """
     Convierte una ruta de índices en un Feature GeoJSON tipo LineString
@@ -454,38 +674,67 @@ def route_nodes_to_geojson_feature(route: List[int], path_matrix: List[List[List
 # =====================================================
 
 @app.get("/tsp/evaluate")
-def evaluate_tsp():
+def evaluate_tsp(rebuild: bool = False):
     """
     Caso de uso 3.3:
       - Construye un grafo de la red vial (EDGES).
       - Calcula la distancia más corta en la red entre cada par de puntos integrados.
       - Ejecuta los tres algoritmos TSP (fuerza bruta, vecino más cercano,
         simulated annealing) usando esa matriz de distancias.
+        Fuerza bruta solo corre hasta BRUTE_FORCE_MAX_POINTS puntos;
+        por encima, "bruteforce" vale null.
       - Devuelve rutas y métricas.
       - Las geometrías de las rutas siguen la red vial (no líneas rectas).
 
     Esto cumple la exigencia de trabajar sobre "shortest path over a network".
+
+    La matriz se reutiliza entre evaluaciones (y se extiende de forma
+    aproximada al agregar puntos); con rebuild=true se recalcula completa.
     """
-    # 1) Matrices de distancias y caminos sobre la red
-    dist_matrix, path_matrix = compute_distance_and_paths()
+    global BEST_ROUTE
+
+    with STATE_LOCK:
+        n_points = len(POINTS_SNAPPED)
+    if n_points < 2:
+        raise HTTPException(
+            status_code=400,
+            detail="Se requieren al menos 2 puntos integrados para evaluar TSP.",
+        )
+
+    # 1) Matrices de distancias y caminos sobre la red (cacheadas).
+    #    Los algoritmos corren sobre una copia, fuera del lock, para que
+    #    agregar/quitar puntos no modifique la matriz bajo el solver.
+    dist_matrix, path_matrix, version = get_distance_and_paths(rebuild)
 
     # 2) Ejecutar algoritmos TSP sobre la matriz
-    bf_route, bf_dist, bf_time = brute_force_tsp_matrix(dist_matrix)
     nn_route, nn_dist, nn_time = nearest_neighbor_tsp_matrix(dist_matrix)
     sa_route, sa_dist, sa_time = simulated_annealing_tsp_matrix(dist_matrix)
+    candidates = [(nn_dist, nn_route), (sa_dist, sa_route)]
+
+    bruteforce = None
+    if len(dist_matrix) <= BRUTE_FORCE_MAX_POINTS:
+        bf_route, bf_dist, bf_time = brute_force_tsp_matrix(dist_matrix)
+        candidates.append((bf_dist, bf_route))
+        bruteforce = {
+            "route": bf_route,
+            "distance": bf_dist,
+            "time": bf_time,
+            "geojson": route_nodes_to_geojson_feature(bf_route, path_matrix),
+        }
 
     # 3) Convertir rutas a GeoJSON siguiendo la red
-    bf_geo = route_nodes_to_geojson_feature(bf_route, path_matrix)
     nn_geo = route_nodes_to_geojson_feature(nn_route, path_matrix)
     sa_geo = route_nodes_to_geojson_feature(sa_route, path_matrix)
 
+    # 4) Guardamos la mejor ruta para re-planificar de forma incremental,
+    #    salvo que la caché haya cambiado mientras corrían los algoritmos
+    #    (si no, se perderían los puntos agregados/quitados entretanto).
+    with STATE_LOCK:
+        if CACHE_VERSION == version:
+            BEST_ROUTE = min(candidates, key=lambda x: x[0])[1][:]
+
     return {
-        "bruteforce": {
-            "route": bf_route,
-            "distance": bf_dist,
-            "time": bf_time,
-            "geojson": bf_geo,
-        },
+        "bruteforce": bruteforce,
         "nearest_neighbor": {
             "route": nn_route,
             "distance": nn_dist,
@@ -499,3 +748,128 @@ def evaluate_tsp():
             "geojson": sa_geo,
         },
     }
+
+
+# =====================================================
+# Re-planificación incremental: agregar / quitar puntos
+# =====================================================
+
+def best_route_response(dist: float, elapsed: float):
+    """
+    Empaqueta la mejor ruta cacheada con el mismo formato de /tsp/evaluate.
+    """
+    return {
+        "route": BEST_ROUTE,
+        "distance": dist,
+        "time": elapsed,
+        "geojson": route_nodes_to_geojson_feature(BEST_ROUTE, PATH_MATRIX),
+    }
+
+
+@app.post("/points")
+def add_point(point: PointIn):
+    """
+    Integra un único punto en la red sin re-evaluar todo el TSP.
+
+    Se ejecuta un solo Dijkstra desde el punto nuevo; si no llega a todos
+    los demás puntos se rechaza (400) y la red no se modifica.
+
+    Si ya hay matrices cacheadas (de /tsp/evaluate):
+      - Se extiende la matriz con una fila y una columna.
+      - La mejor ruta se actualiza con inserción más barata seguida
+        de una reparación local 2-opt (si aún no hay ruta, se siembra
+        con vecino más cercano + 2-opt).
+    """
+    global EDGES, GRAPH, BEST_ROUTE
+
+    with STATE_LOCK:
+        if not EDGES:
+            raise HTTPException(400, "Primero debe cargarse una red (/upload/network).")
+        if any(p["id"] == point.id for p in POINTS_SNAPPED):
+            raise HTTPException(400, f"Ya existe un punto con id={point.id}.")
+
+        cache_valid = bool(DIST_MATRIX) and len(DIST_MATRIX) == len(POINTS_SNAPPED)
+
+        # Partimos la red y verificamos que el punto quede conectado con los
+        # demás antes de registrarlo; si no, la red vuelve a como estaba.
+        # El grafo cacheado se actualiza en el lugar (solo la arista partida).
+        edges_before = EDGES
+        snapped_info, parts = snap_point_to_network(point.id, point.lat, point.lon)
+        lon, lat = snapped_info["snapped"]["coordinates"]
+        try:
+            if GRAPH is None:
+                GRAPH = build_network_graph(EDGES)
+            elif parts:
+                replace_edge_in_graph(GRAPH, edges_before[snapped_info["edge_index"]], parts)
+            new_row, new_paths = shortest_paths_from_point(GRAPH, (lon, lat))
+        except Exception:
+            # Cualquier fallo (no solo HTTPException) deja la red como estaba;
+            # el grafo se descarta y se reconstruye en el próximo uso.
+            EDGES = edges_before
+            GRAPH = None
+            raise
+
+        POINTS_SNAPPED.append(snapped_info)
+
+        best_route = None
+        if cache_valid:
+            new_idx = extend_distance_and_paths((lon, lat), new_row, new_paths)
+
+            if BEST_ROUTE:
+                route, _, ins_time = cheapest_insertion_matrix(DIST_MATRIX, BEST_ROUTE, new_idx)
+            else:
+                # Todavía no hay ruta evaluada: sembramos una con vecino más cercano
+                route, _, ins_time = nearest_neighbor_tsp_matrix(DIST_MATRIX)
+            BEST_ROUTE, dist, opt_time = two_opt_matrix(DIST_MATRIX, route)
+            best_route = best_route_response(dist, ins_time + opt_time)
+        else:
+            invalidate_tsp_cache()
+
+        return {
+            "ok": True,
+            "point": snapped_info,
+            "total_points": len(POINTS_SNAPPED),
+            "edges_after_split": len(EDGES),
+            "best_route": best_route,
+        }
+
+
+@app.delete("/points/{point_id}")
+def remove_point(point_id: str):
+    """
+    Quita un punto integrado sin re-evaluar todo el TSP.
+
+    Si ya hay matrices cacheadas se elimina su fila y columna, y el punto
+    se saca de la mejor ruta, que luego se repara con 2-opt.
+    La red no se modifica (la arista partida sigue partida).
+    """
+    global BEST_ROUTE
+
+    with STATE_LOCK:
+        idx = next(
+            (i for i, p in enumerate(POINTS_SNAPPED) if p["id"] == point_id),
+            None,
+        )
+        if idx is None:
+            raise HTTPException(404, f"No existe un punto con id={point_id}.")
+
+        cache_valid = bool(DIST_MATRIX) and len(DIST_MATRIX) == len(POINTS_SNAPPED)
+        removed = POINTS_SNAPPED.pop(idx)
+
+        best_route = None
+        if cache_valid:
+            shrink_distance_and_paths(idx)
+            if BEST_ROUTE:
+                # Sacamos el punto y corremos los índices posteriores
+                route = [j if j < idx else j - 1 for j in BEST_ROUTE if j != idx]
+                BEST_ROUTE, dist, elapsed = two_opt_matrix(DIST_MATRIX, route)
+                best_route = best_route_response(dist, elapsed)
+        else:
+            invalidate_tsp_cache()
+
+        return {
+            "ok": True,
+            "removed": removed["id"],
+            "total_points": len(POINTS_SNAPPED),
+            "best_route": best_route,
+        }
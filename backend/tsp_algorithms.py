@@ -171,3 +171,105 @@ def simulated_annealing_tsp_matrix(
 
     elapsed = time.time() - start_time
     return best_route, best_dist, elapsed
+
+
+# ===================================================
+# RE-PLANIFICACIÓN INCREMENTAL
+# (se parte de una ruta existente en vez de resolver de nuevo)
+# ===================================================
+
+# ---------------------------------------------------
+# 4. Inserción más barata (cheapest insertion)
+# ---------------------------------------------------
+def cheapest_insertion_matrix(
+    dist_matrix: List[List[float]],
+    route: List[int],
+    new_idx: int,
+) -> Tuple[List[int], float, float]:
+    """
+    Inserta el punto new_idx en la posición de la ruta (camino abierto)
+    que menos incrementa la distancia total, incluidos el inicio y el final.
+    Retorna:
+      - nueva ruta (lista de índices)
+      - distancia total
+      - tiempo de ejecución
+    """
+    start_time = time.time()
+
+    if not route:
+        return [new_idx], 0.0, time.time() - start_time
+
+    best_pos = len(route)
+    best_delta = dist_matrix[route[-1]][new_idx]  # añadir al final
+
+    if dist_matrix[new_idx][route[0]] < best_delta:  # añadir al inicio
+        best_pos = 0
+        best_delta = dist_matrix[new_idx][route[0]]
+
+    for pos in range(1, len(route)):
+        a, b = route[pos - 1], route[pos]
+        delta = dist_matrix[a][new_idx] + dist_matrix[new_idx][b] - dist_matrix[a][b]
+        if delta < best_delta:
+            best_delta = delta
+            best_pos = pos
+
+    new_route = route[:best_pos] + [new_idx] + route[best_pos:]
+
+    total_dist = 0.0
+    for i in range(len(new_route) - 1):
+        total_dist += dist_matrix[new_route[i]][new_route[i + 1]]
+
+    elapsed = time.time() - start_time
+    return new_route, total_dist, elapsed
+
+
+# ---------------------------------------------------
+# 5. Reparación local 2-opt
+# ---------------------------------------------------
+def two_opt_matrix(
+    dist_matrix: List[List[float]],
+    route: List[int],
+    max_passes: int = 10,
+) -> Tuple[List[int], float, float]:
+    """
+    Mejora local 2-opt sobre una ruta abierta: invierte tramos de la ruta
+    mientras eso reduzca la distancia (asume matriz simétrica).
+    Al ser un camino abierto también se pueden invertir prefijos y sufijos,
+    así que el punto de inicio puede cambiar.
+    Retorna:
+      - ruta mejorada (lista de índices)
+      - distancia total
+      - tiempo de ejecución
+    """
+    start_time = time.time()
+    route = route[:]
+    n = len(route)
+
+    for _ in range(max_passes):
+        improved = False
+        for i in range(n - 1):
+            for j in range(i + 1, n):
+                b, c = route[i], route[j]
+                before = 0.0
+                after = 0.0
+                if i > 0:
+                    a = route[i - 1]
+                    before += dist_matrix[a][b]
+                    after += dist_matrix[a][c]
+                if j + 1 < n:
+                    d = route[j + 1]
+                    before += dist_matrix[c][d]
+                    after += dist_matrix[b][d]
+
+                if after < before - 1e-9:
+                    route[i:j + 1] = reversed(route[i:j + 1])
+                    improved = True
+        if not improved:
+            break
+
+    total_dist = 0.0
+    for i in range(n - 1):
+        total_dist += dist_matrix[route[i]][route[i + 1]]
+
+    elapsed = time.time() - start_time
+    return route, total_dist, elapsed
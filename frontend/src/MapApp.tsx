@@ -20,7 +20,7 @@ type TspResult = {
 };
 
 type TspResponse = {
-  bruteforce: TspResult;
+  bruteforce: TspResult | null; // null si hay demasiados puntos
   nearest_neighbor: TspResult;
   simulated_annealing: TspResult;
 };
@@ -212,7 +212,7 @@ export default function MapApp() {
     const fc: FC = {
       type: "FeatureCollection",
       features: [
-        tsp.bruteforce.geojson,
+        ...(tsp.bruteforce ? [tsp.bruteforce.geojson] : []),
         tsp.nearest_neighbor.geojson,
         tsp.simulated_annealing.geojson,
       ],
@@ -415,10 +415,12 @@ export default function MapApp() {
           {tsp && (
             <>
               {/* óptimo (fuerza bruta) en verde fuerte */}
-              <RLGeoJSON
-                data={tsp.bruteforce.geojson as any}
-                style={{ color: "#00c853", weight: 4 }}
-              />
+              {tsp.bruteforce && (
+                <RLGeoJSON
+                  data={tsp.bruteforce.geojson as any}
+                  style={{ color: "#00c853", weight: 4 }}
+                />
+              )}
               {/* vecino más cercano en verde más claro / fino */}
               <RLGeoJSON
                 data={tsp.nearest_neighbor.geojson as any}